@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, List, Optional, Sequence, TextIO
+from typing import Dict, Iterator, List, Optional, Sequence, TextIO
 
 import sys
 
@@ -38,6 +38,7 @@ class GameState:
         self.current_location_label = current_location_label
         self.current_input = ""
         self.state_dict = state_dict or {}
+        self._quantopedia_int = int(self.state_dict.get(_QUANTOPEDIA_KEY, "0"))
         self.user_input = user_input
         self.get_user_input = input_helpers.get_user_input_function(user_input)
         self.file = file
@@ -48,11 +49,11 @@ class GameState:
         The quantopedia is repesented by a bitstring in the
         state_dict.  During a battle, if the bit for the enemy
         NPC is set, then the entry for that type of NPC is displayed.
+
+        The bitstring is kept as an int and only written back to
+        the state_dict when the game is saved.
         """
-        if _QUANTOPEDIA_KEY not in self.state_dict:
-            self.state_dict[_QUANTOPEDIA_KEY] = "0"
-        quantopedia_num = int(self.state_dict[_QUANTOPEDIA_KEY]) | num
-        self.state_dict[_QUANTOPEDIA_KEY] = str(quantopedia_num)
+        self._quantopedia_int |= num
 
     def has_quantopedia(self, num: int) -> bool:
         """Convenience method for getting  a quantopedia bit.
@@ -61,10 +62,7 @@ class GameState:
         state_dict.  During a battle, if the bit for the enemy
         NPC is set, then the entry for that type of NPC is displayed.
         """
-        if _QUANTOPEDIA_KEY not in self.state_dict:
-            return False
-        quantopedia_num = int(self.state_dict[_QUANTOPEDIA_KEY])
-        return quantopedia_num & num != 0
+        return self._quantopedia_int & num != 0
 
     def with_save_file(self, save_file) -> "Optional[GameState]":
         """Modifies GameState object in place to load info from save file.
@@ -75,26 +73,40 @@ class GameState:
         in progress, since we don't want to lose the state of where we
         are in parsing the user input.
         """
-        lines = save_file.split(_SAVE_DELIMITER)
-        if len(lines) < 2:
+        # Locate the header fields first so that malformed save files
+        # are rejected before the rest of the file is split.
+        label_end = save_file.find(_SAVE_DELIMITER)
+        if label_end < 0:
             return None
-        self.current_location_label = lines[0]
+        num_party_end = save_file.find(_SAVE_DELIMITER, label_end + 1)
+        if num_party_end < 0:
+            num_party_str = save_file[label_end + 1 :]
+            lines: List[str] = []
+        else:
+            num_party_str = save_file[label_end + 1 : num_party_end]
+            lines = save_file[num_party_end + 1 :].split(_SAVE_DELIMITER)
+        self.current_location_label = save_file[:label_end]
         party: List[qaracter.Qaracter] = []
         try:
-            num_party = int(lines[1])
+            num_party = int(num_party_str)
         except ValueError:
             return None
-        if len(lines) < 2 + num_party:
+        if len(lines) < num_party:
             return None
-        for party_idx in range(2, 2 + num_party):
+        for party_idx in range(num_party):
             party.append(qaracter.Qaracter.from_save_file(lines[party_idx]))
         state_dict = {}
-        for line in lines[2 + num_party :]:
-            dict_value = line.split(":")
+        for line in lines[num_party:]:
+            dict_value = line.split(_DICT_DELIMITER, 1)
             if len(dict_value) < 2:
                 continue
             state_dict[dict_value[0]] = dict_value[1]
+        try:
+            quantopedia_int = int(state_dict.get(_QUANTOPEDIA_KEY, "0"))
+        except ValueError:
+            return None
         self.state_dict = state_dict
+        self._quantopedia_int = quantopedia_int
         self.party = party
         return self
 
@@ -108,11 +120,28 @@ class GameState:
         """Creates a new Gamestate from a save file."""
         return cls([], "", {}, user_input, file).with_save_file(save_file)
 
-    def to_save_file(self) -> str:
-        """Serializes a GameState into a string for saving/loading."""
-        s = f"{self.current_location_label}{_SAVE_DELIMITER}{len(self.party)}{_SAVE_DELIMITER}"
+    def _save_file_parts(self) -> Iterator[str]:
+        """Yields the fields of the save file, without delimiters."""
+        if self._quantopedia_int:
+            self.state_dict[_QUANTOPEDIA_KEY] = str(self._quantopedia_int)
+        yield self.current_location_label
+        yield str(len(self.party))
         for p in self.party:
-            s += p.to_save_file() + _SAVE_DELIMITER
+            yield p.to_save_file()
         for k, v in self.state_dict.items():
-            s += f"{k}{_DICT_DELIMITER}{v}{_SAVE_DELIMITER}"
-        return s[:-1]
+            yield f"{k}{_DICT_DELIMITER}{v}"
+
+    def to_save_file(self, out: Optional[TextIO] = None) -> Optional[str]:
+        """Serializes a GameState into a string for saving/loading.
+
+        If `out` is supplied, the save file is written to it directly
+        and None is returned.
+        """
+        parts = self._save_file_parts()
+        if out is None:
+            return _SAVE_DELIMITER.join(parts)
+        out.write(next(parts))
+        for part in parts:
+            out.write(_SAVE_DELIMITER)
+            out.write(part)
+        return None
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+
 import unitary.alpha as alpha
 
 from . import qaracter
@@ -54,10 +56,38 @@ def test_serialization() -> None:
     assert deserialized_qar2.circuit == qar2.circuit
 
 
+def test_serialization_to_file() -> None:
+    qar = qaracter.Qaracter(name="plato")
+    qar.add_quantum_effect(alpha.Flip(), 1)
+    state = game_state.GameState(
+        party=[qar], state_dict={"puzzle1": "complete"}, current_location_label="lab"
+    )
+    out = io.StringIO()
+    assert state.to_save_file(out) is None
+    assert out.getvalue() == state.to_save_file()
+
+
 def test_bad_input():
     assert game_state.GameState.from_save_file("") is None
     assert game_state.GameState.from_save_file("ding;dong") is None
     assert game_state.GameState.from_save_file("ding;2;dong") is None
+    assert game_state.GameState.from_save_file("ding;0;qp:dong") is None
+    assert game_state.GameState.from_save_file("ding;1") is None
+
+
+def test_empty_save_file():
+    state = game_state.GameState([], "lab")
+    assert state.to_save_file() == "lab;0"
+    deserialized_state = game_state.GameState.from_save_file("lab;0")
+    assert deserialized_state.current_location_label == "lab"
+    assert deserialized_state.party == []
+    assert deserialized_state.state_dict == {}
+
+
+def test_state_dict_value_with_delimiter():
+    state = game_state.GameState([], "lab", {"note": "a:b"})
+    deserialized_state = game_state.GameState.from_save_file(state.to_save_file())
+    assert deserialized_state.state_dict == {"note": "a:b"}
 
 
 def test_quantopedia():
@@ -72,3 +102,11 @@ def test_quantopedia():
     assert state.has_quantopedia(4)
     assert not state.has_quantopedia(2)
     assert state.has_quantopedia(1)
+
+
+def test_quantopedia_serialization():
+    state = game_state.GameState([])
+    state.set_quantopedia(2)
+    deserialized_state = game_state.GameState.from_save_file(state.to_save_file())
+    assert deserialized_state.has_quantopedia(2)
+    assert not deserialized_state.has_quantopedia(1)
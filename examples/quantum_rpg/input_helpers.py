@@ -32,8 +32,8 @@ def get_user_input_function(user_input: Optional[Sequence[str]] = None) -> _USER
     If not, use stdin.
     """
     if user_input is not None:
-        iter_input = iter(user_input)
-        return lambda _: next(iter_input)
+        next_input = iter(user_input).__next__
+        return lambda _: next_input()
     else:
         return input
 
@@ -13,8 +13,7 @@
 # limitations under the License.
 
 import enum
-import textwrap
-from typing import Optional, Sequence
+from typing import Callable, Dict, Optional, Sequence, Union
 
 from . import ascii_art
 from . import battle
@@ -59,32 +58,72 @@ class Command(enum.Enum):
         # input is lower-cased and matched against every other command.
         if cls.QUIT.value.startswith(s):
             return cls.QUIT
-        lower_s = s.lower()
-        candidates = []
-        for cmd in cls:
-            # Quit has already been handled above.
-            if cmd == cls.QUIT:
-                continue
-            if cmd.value.startswith(lower_s):
-                candidates.append(cmd)
-        if len(candidates) == 1:
-            return candidates[0]
-        if len(candidates) > 1:
+        # Interactive input is usually already lower case.
+        lower_s = s if s.islower() else s.lower()
+        if lower_s not in _COMMAND_PREFIXES:
+            return None
+        cmd = _COMMAND_PREFIXES[lower_s]
+        if cmd is None:
             raise AmbiguousCommandError
-        return None
+        return cmd
 
     @classmethod
     def help(cls) -> str:
-        cmds = ["Available commands:"]
-        for cmd in Command:
-            cmds.append(f"  {cmd.value}")
-        return "\n".join(cmds)
+        return _COMMAND_HELP
+
+
+def _command_prefixes() -> Dict[str, Optional[Command]]:
+    """Maps every prefix of every command to the command it selects.
+
+    Prefixes shared by more than one command map to None.
+    Quit is case-sensitive and is matched separately by `Command.parse`.
+    """
+    prefixes: Dict[str, Optional[Command]] = {}
+    for cmd in Command:
+        if cmd == Command.QUIT:
+            continue
+        for idx in range(1, len(cmd.value) + 1):
+            prefix = cmd.value[:idx]
+            prefixes[prefix] = None if prefix in prefixes else cmd
+    return prefixes
+
+
+_COMMAND_PREFIXES = _command_prefixes()
+_COMMAND_HELP = "\n".join(
+    ["Available commands:"] + [f"  {cmd.value}" for cmd in Command]
+)
+
+
+def _input_prefixes() -> Dict[str, Union[world.Direction, Command, None]]:
+    """Maps every prefix of every direction and command to what it selects.
+
+    Directions take precedence over commands, since user input is tried
+    as a direction first.  Prefixes shared by more than one command map
+    to None.
+    """
+    direction_prefixes: Dict[str, world.Direction] = {}
+    for direction in world.Direction:
+        for idx in range(1, len(direction.value) + 1):
+            direction_prefixes.setdefault(direction.value[:idx], direction)
+    return {**_COMMAND_PREFIXES, **direction_prefixes}
+
+
+_INPUT_PREFIXES = _input_prefixes()
 
 
 class MainLoop:
     def __init__(self, world: world.World, state: game_state.GameState):
         self.world = world
         self.game_state = state
+        # Each handler returns whether to print the room description afterwards.
+        self._command_handlers: Dict[Optional[Command], Callable[[], bool]] = {
+            Command.STATUS: self._status,
+            Command.HELP: self._help,
+            Command.QUANTOPEDIA: self._quantopedia,
+            Command.LOAD: self._load,
+            Command.SAVE: self._save,
+            Command.LOOK: self._look,
+        }
 
     @property
     def party(self):
@@ -103,131 +142,137 @@ class MainLoop:
             file=self.file,
         )
 
+    def _status(self) -> bool:
+        self.print_status()
+        return False
+
+    def _help(self) -> bool:
+        print(ascii_art.HELP, file=self.file)
+        return False
+
+    def _quantopedia(self) -> bool:
+        print(file=self.file)
+        print(npcs.render_quantopedia(), file=self.file)
+        return False
+
+    def _load(self) -> bool:
+        print(
+            "Paste the save file here to load the game from that point.",
+            file=self.file,
+        )
+        save_file = self.game_state.get_user_input("")
+        if self.game_state.with_save_file(save_file) is None:
+            print("Unrecognized save file.", file=self.file)
+        else:
+            self.world.current_location = self.world.locations[
+                self.game_state.current_location_label
+            ]
+        return True
+
+    def _save(self) -> bool:
+        print(
+            "Use this code to return to this point in the game:",
+            file=self.file,
+        )
+        print(self.game_state.to_save_file(), file=self.file)
+        print("")
+        return False
+
+    def _look(self) -> bool:
+        print(self.world.current_location, file=self.file)
+        return False
+
     def loop(self, user_input: Optional[Sequence[str]] = None) -> None:
         """Main loop of Quantum RPG.
 
         Loop by getting user input and then acting on it.
         """
+        state = self.game_state
+        game_world = self.world
+        file = self.file
+        get_user_input = state.get_user_input
         print_room_description = True
         try:
             while True:
+                loc = game_world.current_location
                 if print_room_description:
-                    print(self.world.current_location, file=self.file)
-                    if self.world.current_location.encounters:
-                        result = None
-                        # If this location has random encounters, then see if any will
-                        # trigger.  If so, initiate the battle.
-                        for random_encounter in self.world.current_location.encounters:
-                            if random_encounter.will_trigger():
-                                if random_encounter.description:
-                                    print(random_encounter.description, file=self.file)
-                                current_battle = random_encounter.initiate(
-                                    self.game_state
-                                )
-                                result = current_battle.loop()
-                                self.world.current_location.remove_encounter(
-                                    random_encounter
-                                )
-
-                                if result == battle.BattleResult.PLAYERS_WON:
-                                    awarded_xp = current_battle.xp
-                                    xp_utils.award_xp(self.game_state, awarded_xp)
-                                elif result == battle.BattleResult.PLAYERS_DOWN:
-                                    raise exceptions.UntimelyDeathException(
-                                        "You have been defeated!"
-                                    )
-                                break
-                        if result is not None:
-                            # Reprint location description now that encounter is over.
-                            print(self.world.current_location, file=self.file)
+                    description = str(loc)
+                    print(description, file=file)
+                    # If this location has random encounters, then see if any will
+                    # trigger.  If so, initiate the battle.
+                    random_encounter = loc.triggered_encounter()
+                    if random_encounter is not None:
+                        if random_encounter.description:
+                            print(random_encounter.description, file=file)
+                        current_battle = random_encounter.initiate(state)
+                        result = current_battle.loop()
+                        loc.remove_encounter(random_encounter)
+
+                        if result == battle.BattleResult.PLAYERS_WON:
+                            awarded_xp = current_battle.xp
+                            xp_utils.award_xp(state, awarded_xp)
+                        elif result == battle.BattleResult.PLAYERS_DOWN:
+                            raise exceptions.UntimelyDeathException(
+                                "You have been defeated!"
+                            )
+                        # Reprint location description now that encounter is over.
+                        # Battles do not change the location's description.
+                        print(description, file=file)
 
                 print_room_description = True
-                current_input = self.game_state.get_user_input(">")
-                self.game_state.current_input = current_input
-                cmd = world.Direction.parse(current_input)
-                if cmd is not None:
-                    new_location = self.world.move(cmd)
+                current_input = get_user_input(">")
+                state.current_input = current_input
+                lower_input = (
+                    current_input if current_input.islower() else current_input.lower()
+                )
+                parsed_input = _INPUT_PREFIXES.get(lower_input)
+                if isinstance(parsed_input, world.Direction):
+                    new_location = game_world.move(parsed_input)
                     if new_location is not None:
-                        self.game_state.current_location_label = new_location.label
+                        state.current_location_label = new_location.label
                     continue
-                action = self.world.current_location.get_action(current_input)
+                action = loc.get_action(current_input)
                 if action is not None:
                     if isinstance(action, str):
-                        print(action, file=self.file)
+                        print(action, file=file)
                     elif callable(action):
-                        msg = action(self.game_state, self.world)
+                        msg = action(state, game_world)
+                        # Actions can modify the location, such as its exits.
+                        loc.invalidate()
                         if msg:
-                            print(msg, file=self.file)
-                    print_room_description = False
-                    continue
-                try:
-                    input_cmd = Command.parse(current_input)
-                except AmbiguousCommandError:
-                    print(
-                        f"Ambiguous command '{current_input}'.",
-                        Command.help(),
-                        file=self.file,
-                    )
+                            print(msg, file=file)
                     print_room_description = False
                     continue
-                if input_cmd == Command.QUIT:
+                if current_input and Command.QUIT.value.startswith(current_input):
+                    # Quit is case-sensitive, so it is not in the prefix table.
                     return
-                elif input_cmd == Command.STATUS:
-                    self.print_status()
-                    print_room_description = False
-                elif input_cmd == Command.HELP:
-                    print(ascii_art.HELP, file=self.file)
-                    print_room_description = False
-                elif input_cmd == Command.QUANTOPEDIA:
-                    print(file=self.file)
-                    for npc_class in npcs.Npc.__subclasses__():
-                        print(npc_class.__name__, file=self.file)
-                        print(
-                            textwrap.indent(npc_class.quantopedia_entry(), "  "),
-                            file=self.file,
-                        )
-                        print(file=self.file)
-                    print_room_description = False
-                elif input_cmd == Command.LOAD:
+                if parsed_input is None and lower_input in _INPUT_PREFIXES:
                     print(
-                        "Paste the save file here to load the game from that point.",
-                        file=self.file,
+                        f"Ambiguous command '{current_input}'. {Command.help()}",
+                        file=file,
                     )
-                    save_file = self.game_state.get_user_input("")
-                    if self.game_state.with_save_file(save_file) is None:
-                        print("Unrecognized save file.", file=self.file)
-                    else:
-                        self.world.current_location = self.world.locations[
-                            self.game_state.current_location_label
-                        ]
-                elif input_cmd == Command.SAVE:
-                    print(
-                        "Use this code to return to this point in the game:",
-                        file=self.file,
-                    )
-                    print(self.game_state.to_save_file(), file=self.file)
-                    print("")
-                    print_room_description = False
-                elif input_cmd == Command.LOOK:
-                    print(self.world.current_location, file=self.file)
                     print_room_description = False
-                else:
+                    continue
+                handler = self._command_handlers.get(parsed_input)
+                if handler is None:
                     print(
                         f"I did not understand the command {current_input}.",
-                        file=self.file,
+                        file=file,
                     )
                     print_room_description = False
+                    continue
+                print_room_description = handler()
         except exceptions.UntimelyDeathException as e:
-            print(e, file=self.file)
-            print(ascii_art.RIP_TOP, file=self.file)
-            for qar in self.game_state.party:
-                print(f"     |       | {qar.name: ^16} |", file=self.file)
-            print(ascii_art.RIP_BOTTOM, file=self.file)
+            print(e, file=file)
+            print(ascii_art.RIP_TOP, file=file)
+            for qar in state.party:
+                print(f"     |       | {qar.name: ^16} |", file=file)
+            print(ascii_art.RIP_BOTTOM, file=file)
             print(
                 "You have been measured and were found wanting.",
-                file=self.file,
+                file=file,
             )
-            print("Better luck next repetition.", file=self.file)
+            print("Better luck next repetition.", file=file)
             return
 
 
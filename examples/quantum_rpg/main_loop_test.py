@@ -15,6 +15,8 @@
 import io
 from typing import cast
 
+import pytest
+
 import unitary.alpha as alpha
 
 from . import ascii_art
@@ -111,6 +113,11 @@ def test_parse_commands() -> None:
     assert main_loop.Command.parse("Quitt") is None
     assert main_loop.Command.parse("quit") is None
     assert main_loop.Command.parse("load") is main_loop.Command.LOAD
+    assert main_loop.Command.parse("loa") is main_loop.Command.LOAD
+    assert main_loop.Command.parse("LOOK") is main_loop.Command.LOOK
+    assert main_loop.Command.parse("loadd") is None
+    with pytest.raises(main_loop.AmbiguousCommandError):
+        main_loop.Command.parse("lo")
 
 
 def test_simple_main_loop() -> None:
@@ -162,6 +169,32 @@ I did not understand the command .
     )
 
 
+def test_ambiguous_command() -> None:
+    state = game_state.GameState(party=[], user_input=["l", "Quit"], file=io.StringIO())
+    loop = main_loop.MainLoop(state=state, world=world.World(example_world()))
+    loop.loop()
+    assert (
+        cast(io.StringIO, state.file).getvalue().replace("\t", " ").strip()
+        == r"""
+Lab Entrance
+
+You stand before the entrance to the premier quantum lab.
+Double doors lead east.
+
+Exits: east.
+
+Ambiguous command 'l'. Available commands:
+  load
+  look
+  status
+  save
+  help
+  quantopedia
+  Quit
+""".strip()
+    )
+
+
 def test_status() -> None:
     c = classes.Analyst("Nova")
     c.add_quantum_effect(alpha.Flip(), 1)
@@ -14,13 +14,14 @@
 
 from typing import cast, List
 
+import functools
 import random
+import textwrap
 
 import unitary.alpha as alpha
 
 from . import qaracter
 
-
 # QUANTOPEDIA ENTRIES
 #
 #
@@ -31,23 +32,27 @@ _HILLS_QUANTOPEDIA = 2
 # Reserved for Perimeter institute, to be implemented.
 _PERIMETER_QUANTOPEDIA = 4
 
+# Bound methods of the module-level RNG, used on every NPC turn.
+_choice = random.choice
+_random = random.random
+
 
 def _enemy_qubits(party: List[qaracter.Qaracter]) -> List[alpha.QuantumObject]:
     """Determines valid enemy target qubits and returns them with the player."""
-    enemy_qubits: List[alpha.QuantumObject] = []
-    for player in party:
-        for q in player.active_qubits():
-            hp = player.get_hp(q)
-            if hp is not None:
-                enemy_qubits.append(hp)
-    return enemy_qubits
+    return [
+        hp
+        for player in party
+        for q in player.active_qubits()
+        if (hp := player.get_hp(q)) is not None
+    ]
 
 
 def _sample_qubit(my_name: str, enemy_qubit: alpha.QuantumObject) -> str:
-    if not enemy_qubit.world:
-        return f"{enemy_qubit.name} is without a world!"
     enemy_name = enemy_qubit.name
-    value = cast(qaracter.Qaracter, enemy_qubit.world).sample(enemy_name, True)
+    enemy_world = enemy_qubit.world
+    if not enemy_world:
+        return f"{enemy_name} is without a world!"
+    value = cast(qaracter.Qaracter, enemy_world).sample(enemy_name, True)
     return f"{my_name} measures {enemy_name} as {value.name}."
 
 
@@ -75,8 +80,8 @@ class Npc(qaracter.Qaracter):
         return ""
 
     def npc_action(self, battle, **kwargs) -> str:
-        enemy_qubit = random.choice(_enemy_qubits(battle.player_side))
-        action_choice = random.random()
+        enemy_qubit = _choice(_enemy_qubits(battle.player_side))
+        action_choice = _random()
         return self.act_on_enemy_qubit(enemy_qubit, action_choice, **kwargs)
 
     def quantopedia_index(self) -> int:
@@ -130,7 +135,7 @@ class BlueFoam(Npc):
 
     def act_on_enemy_qubit(self, enemy_qubit, action_choice, **kwargs) -> str:
         if action_choice > 0.2:
-            slime = kwargs.get("slime") or random.randint(0, 250) / 1000.0
+            slime = kwargs.get("slime") or _random() * 0.25
             alpha.Flip(effect_fraction=slime)(enemy_qubit)
             return f"{self.display_name} slimes {enemy_qubit.name} for {slime:0.3f}."
         else:
@@ -157,7 +162,7 @@ class GreenFoam(Npc):
 
     def act_on_enemy_qubit(self, enemy_qubit, action_choice, **kwargs) -> str:
         if action_choice > 0.2:
-            slime = kwargs.get("slime") or random.randint(0, 250) / 1000.0
+            slime = kwargs.get("slime") or _random() * 0.25
             alpha.Phase(effect_fraction=slime)(enemy_qubit)
             return (
                 f"{self.display_name} oozes {enemy_qubit.name} for {slime:0.3f} phase."
@@ -190,7 +195,7 @@ class RedFoam(Npc):
 
     def act_on_enemy_qubit(self, enemy_qubit, action_choice, **kwargs) -> str:
         if action_choice > 0.2:
-            slime = kwargs.get("slime") or random.randint(0, 350) / 1000.0
+            slime = kwargs.get("slime") or _random() * 0.35
             alpha.Flip(effect_fraction=slime)(enemy_qubit)
             return f"{self.display_name} slimes {enemy_qubit.name} for {slime:0.3f}."
         else:
@@ -259,10 +264,9 @@ class SchrodingerCat(Npc):
         super().__init__(name)
         first_hp = self.get_hp(self.quantum_object_name(1))
         alpha.Superposition()(first_hp)
-        for q in range(1, num_qubits):
-            self.add_hp()
-            this_hp = self.get_hp(self.quantum_object_name(q + 1))
-            alpha.quantum_if(first_hp).apply(alpha.Flip())(this_hp)
+        other_hps = [self.add_hp() for _ in range(1, num_qubits)]
+        if other_hps:
+            alpha.quantum_if(first_hp).apply(alpha.Flip())(*other_hps)
 
     def act_on_enemy_qubit(self, enemy_qubit, action_choice, **kwargs) -> str:
         if action_choice > 0.5:
@@ -283,3 +287,15 @@ class SchrodingerCat(Npc):
             "of all ones or all zeros.  These cats have been known to apply\n"
             "Hadamard gates with their claws and measure opponents."
         )
+
+
+@functools.lru_cache(maxsize=1)
+def render_quantopedia() -> str:
+    """Renders the quantopedia entries of all NPC classes.
+
+    Entries are constant, so the text is only generated once.
+    """
+    return "\n".join(
+        f"{npc_class.__name__}\n{textwrap.indent(npc_class.quantopedia_entry(), '  ')}\n"
+        for npc_class in Npc.__subclasses__()
+    )
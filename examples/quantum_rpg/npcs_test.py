@@ -111,3 +111,10 @@ def test_schrodinger_cat():
     assert msg == "SchrodingerCat nice_kitty measures person_1 as HURT."
     msg = qar.act_on_enemy_qubit(c.get_hp("person_1"), 0.6, slime=0.25)
     assert msg == "SchrodingerCat nice_kitty scratches person_1 into a superposition!"
+
+
+def test_render_quantopedia():
+    quantopedia = npcs.render_quantopedia()
+    assert quantopedia.startswith("Observer\n  Observers are known")
+    assert "\nSchrodingerCat\n  Schrödinger's cat" in quantopedia
+    assert npcs.render_quantopedia() is quantopedia
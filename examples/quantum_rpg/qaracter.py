@@ -12,8 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import cast, Dict, List, Optional, Union
-import inspect
+from typing import cast, Dict, List, Optional, Type, Union
 
 import cirq
 from unitary import alpha
@@ -22,6 +21,9 @@ from . import enums
 _GATE_DELIMITER = ","
 _FIELD_DELIMITER = "#"
 
+# Subclasses of Qaracter by class name, used to restore saved Qaracters.
+_QARACTER_CLASSES: Dict[str, Type["Qaracter"]] = {}
+
 
 class Qaracter(alpha.QuantumWorld):
     """Base class for quantum RPG characters.
@@ -53,6 +55,10 @@ class Qaracter(alpha.QuantumWorld):
         name: name of this character as a string.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _QARACTER_CLASSES[cls.__name__] = cls
+
     def __init__(self, name: str = "", **kwargs):
         super().__init__(**kwargs)
         self.name = name
@@ -217,14 +223,10 @@ class Qaracter(alpha.QuantumWorld):
         name = lines[0]
         class_name = lines[1]
 
-        # Avoid circular import
-        from . import classes
+        # Avoid circular import.  Importing registers the player classes.
+        from . import classes  # pylint: disable=unused-import
 
-        class_tuples = inspect.getmembers(classes, inspect.isclass)
-        new_cls = cls
-        for cls_name, cls_type in class_tuples:
-            if cls_name == class_name:
-                new_cls = cls_type
+        new_cls = _QARACTER_CLASSES.get(class_name, cls)
         qar = new_cls(name)
         try:
             level = int(lines[2])
@@ -196,3 +196,9 @@ def test_serialization() -> None:
     assert deserialized_qar.name == qar.name
     assert deserialized_qar.level == qar.level
     assert deserialized_qar.circuit == qar.circuit
+
+
+def test_serialization_restores_class():
+    qar = classes.Engineer(name="watt")
+    deserialized_qar = qaracter.Qaracter.from_save_file(qar.to_save_file())
+    assert isinstance(deserialized_qar, classes.Engineer)
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
 import dataclasses
 import enum
+import random
 from typing import Dict, List, Optional, Sequence
 
 from . import encounter, item
@@ -35,11 +37,19 @@ class Direction(enum.Enum):
         """
         if not s:
             return None
-        lower_s = s.lower()
-        for d in Direction:
-            if d.value.startswith(lower_s):
-                return d
-        return None
+        return _DIRECTION_PREFIXES.get(s if s.islower() else s.lower())
+
+
+def _direction_prefixes() -> Dict[str, Direction]:
+    """Maps every prefix of every direction to the first direction it matches."""
+    prefixes: Dict[str, Direction] = {}
+    for d in Direction:
+        for idx in range(1, len(d.value) + 1):
+            prefixes.setdefault(d.value[:idx], d)
+    return prefixes
+
+
+_DIRECTION_PREFIXES = _direction_prefixes()
 
 
 @dataclasses.dataclass
@@ -56,6 +66,8 @@ class Location:
         encounter: Sequence of encounters that can be
            visited here.
 
+    The rendered description is cached.  Call `invalidate` after
+    modifying the title, description, exits, or items.
     """
 
     label: str
@@ -64,6 +76,12 @@ class Location:
     encounters: Optional[List[encounter.Encounter]] = None
     description: Optional[str] = None
     items: Optional[List[item.Item]] = None
+    _rendered: Optional[str] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _trigger_thresholds: Optional[List[float]] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def _exits(self) -> str:
         return ", ".join(sorted(ex.value for ex in self.exits)) + "."
@@ -86,10 +104,48 @@ class Location:
 
     def remove_encounter(self, triggered_encounter: encounter.Encounter) -> None:
         if self.encounters:
+            self._trigger_thresholds = None
             return self.encounters.remove(triggered_encounter)
 
+    def _encounter_thresholds(self) -> List[float]:
+        """Cumulative probabilities of each encounter being the first to trigger."""
+        thresholds = []
+        cumulative = 0.0
+        none_triggered = 1.0
+        for e in self.encounters or []:
+            probability = min(max(e.probability, 0.0), 1.0)
+            cumulative += none_triggered * probability
+            none_triggered *= 1.0 - probability
+            thresholds.append(cumulative)
+        return thresholds
+
+    def triggered_encounter(self) -> Optional[encounter.Encounter]:
+        """Returns the encounter that triggers on this visit, if any.
+
+        Encounters are tried in order and the first one that triggers is
+        returned.  This is sampled with a single random draw against the
+        cumulative probability of each encounter being the first to trigger.
+        """
+        if not self.encounters:
+            return None
+        if self._trigger_thresholds is None:
+            self._trigger_thresholds = self._encounter_thresholds()
+        if self._trigger_thresholds[-1] <= 0.0:
+            # None of the remaining encounters can trigger.
+            return None
+        idx = bisect.bisect_right(self._trigger_thresholds, random.random())
+        if idx < len(self.encounters):
+            return self.encounters[idx]
+        return None
+
+    def invalidate(self) -> None:
+        """Discards the cached description after the location changes."""
+        self._rendered = None
+
     def __str__(self) -> str:
-        return f"{self.title}\n\n{self.description}\n{self._item_str()}\nExits: {self._exits()}\n"
+        if self._rendered is None:
+            self._rendered = f"{self.title}\n\n{self.description}\n{self._item_str()}\nExits: {self._exits()}\n"
+        return self._rendered
 
 
 class World:
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import random
+
+from . import encounter
 from . import world
 
 
@@ -81,3 +84,48 @@ def test_location():
     assert example_world.move(world.Direction.WEST) is None
     assert example_world.move(world.Direction.NORTH).label == "2"
     assert example_world.current_location.label == "2"
+
+
+def test_location_str_cache():
+    location = world.Location(
+        label="1", title="cave", description="Dark.", exits={world.Direction.EAST: "2"}
+    )
+    assert str(location) == "cave\n\nDark.\n\nExits: east.\n"
+    location.exits[world.Direction.WEST] = "3"
+    assert str(location) == "cave\n\nDark.\n\nExits: east.\n"
+    location.invalidate()
+    assert str(location) == "cave\n\nDark.\n\nExits: east, west.\n"
+
+
+def test_triggered_encounter():
+    never = encounter.Encounter([], 0.0)
+    always = encounter.Encounter([], 1.0)
+    location = world.Location(
+        label="1", title="cave", exits={}, encounters=[never, always]
+    )
+    assert all(location.triggered_encounter() is always for _ in range(100))
+    location.remove_encounter(always)
+    assert all(location.triggered_encounter() is None for _ in range(100))
+    location.remove_encounter(never)
+    assert location.triggered_encounter() is None
+
+
+def test_triggered_encounter_order():
+    first = encounter.Encounter([], 0.5)
+    second = encounter.Encounter([], 1.0)
+    location = world.Location(
+        label="1", title="cave", exits={}, encounters=[first, second]
+    )
+    results = [location.triggered_encounter() for _ in range(100)]
+    assert first in results
+    assert second in results
+    assert None not in results
+
+
+def test_triggered_encounter_never():
+    location = world.Location(
+        label="1", title="cave", exits={}, encounters=[encounter.Encounter([], 0.0)]
+    )
+    rng_state = random.getstate()
+    assert location.triggered_encounter() is None
+    assert random.getstate() == rng_state